@@ -57,3 +57,98 @@ def test_datetime_handling_in_update_source_metadata(
     assert ingest_doc.source_metadata is not None
     assert ingest_doc.source_metadata.date_created.startswith(expected_created)
     assert ingest_doc.source_metadata.date_modified.startswith(expected_modified)
+
+
+def test_update_source_metadata_uses_file_listing_properties(mocker):
+    """File metadata captured at listing time is used without re-fetching the file."""
+    fetch_file_mock = mocker.patch(
+        "unstructured_ingest.connector.sharepoint.SharepointIngestDoc._fetch_file",
+    )
+
+    ingest_doc = SharepointIngestDoc(
+        connector_config=MagicMock(permissions_config=None),
+        site_url="dummy_url",
+        server_path="dummy_path",
+        is_page=False,
+        file_path="dummy_path.html",
+        file_properties={
+            "TimeCreated": "2023-06-16T05:05:05+00:00",
+            "TimeLastModified": "2023-06-17T05:05:05+00:00",
+            "MajorVersion": 2,
+            "LinkingUrl": "https://tenant.sharepoint.com/doc",
+        },
+        processor_config=ProcessorConfig(),
+        read_config=ReadConfig(),
+    )
+
+    ingest_doc.update_source_metadata()
+
+    fetch_file_mock.assert_not_called()
+    assert ingest_doc.source_metadata.exists is True
+    assert ingest_doc.source_metadata.date_created == "2023-06-16T05:05:05+00:00"
+    assert ingest_doc.source_metadata.date_modified == "2023-06-17T05:05:05+00:00"
+    assert ingest_doc.source_metadata.version == 2
+    assert ingest_doc.source_metadata.source_url == "https://tenant.sharepoint.com/doc"
+
+
+def test_update_source_metadata_uses_page_listing_properties(mocker):
+    """Page metadata captured at listing time is used without re-fetching the page."""
+    fetch_page_mock = mocker.patch(
+        "unstructured_ingest.connector.sharepoint.SharepointIngestDoc._fetch_page",
+    )
+
+    ingest_doc = SharepointIngestDoc(
+        connector_config=MagicMock(permissions_config=None),
+        site_url="dummy_url",
+        server_path="SitePages/home.aspx",
+        is_page=True,
+        file_path="SitePages/home.aspx",
+        file_properties={
+            "FirstPublished": "2023-06-16T05:05:05Z",
+            "Modified": "2023-06-17T05:05:05Z",
+            "Version": "1.0",
+            "AbsoluteUrl": "https://tenant.sharepoint.com/SitePages/home.aspx",
+        },
+        processor_config=ProcessorConfig(),
+        read_config=ReadConfig(),
+    )
+
+    ingest_doc.update_source_metadata()
+
+    fetch_page_mock.assert_not_called()
+    assert ingest_doc.source_metadata.exists is True
+    assert ingest_doc.source_metadata.date_created == "2023-06-16T05:05:05Z"
+    assert ingest_doc.source_metadata.date_modified == "2023-06-17T05:05:05Z"
+    assert ingest_doc.source_metadata.version == "1.0"
+    assert (
+        ingest_doc.source_metadata.source_url == "https://tenant.sharepoint.com/SitePages/home.aspx"
+    )
+
+
+def test_update_source_metadata_falls_back_when_listing_properties_incomplete(mocker):
+    """An incomplete captured property set falls back to fetching the file."""
+    mock_sharepoint_response = mocker.MagicMock()
+    mock_sharepoint_response.time_created = "2023-06-16T05:05:05+00:00"
+    mock_sharepoint_response.time_last_modified = "2023-06-17T05:05:05+00:00"
+    fetch_file_mock = mocker.patch(
+        "unstructured_ingest.connector.sharepoint.SharepointIngestDoc._fetch_file",
+        return_value=mock_sharepoint_response,
+    )
+
+    ingest_doc = SharepointIngestDoc(
+        connector_config=MagicMock(permissions_config=None),
+        site_url="dummy_url",
+        server_path="dummy_path",
+        is_page=False,
+        file_path="dummy_path.html",
+        file_properties={"TimeCreated": "2023-06-16T05:05:05+00:00"},
+        processor_config=ProcessorConfig(),
+        read_config=ReadConfig(),
+    )
+
+    ingest_doc.update_source_metadata()
+
+    fetch_file_mock.assert_called_once()
+    assert ingest_doc.source_metadata.exists is True
+    assert ingest_doc.source_metadata.date_created == "2023-06-16T05:05:05+00:00"
+    assert ingest_doc.source_metadata.date_modified == "2023-06-17T05:05:05+00:00"
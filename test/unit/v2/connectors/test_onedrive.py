@@ -0,0 +1,26 @@
+import pickle
+from unittest.mock import MagicMock
+
+from unstructured_ingest.v2.processes.connectors.onedrive import (
+    OnedriveAccessConfig,
+    OnedriveConnectionConfig,
+)
+
+
+def test_connection_config_stays_picklable_after_token_fetch(mocker):
+    """The msal app holds locks, so caching it on the config would break the
+    multiprocessing upload path, which pickles the connection config."""
+    mock_app = MagicMock()
+    mock_app.acquire_token_for_client.return_value = {"access_token": "token"}
+    mocker.patch("msal.ConfidentialClientApplication", return_value=mock_app)
+
+    connection_config = OnedriveConnectionConfig(
+        client_id="client-id",
+        user_pname="user@tenant.com",
+        tenant="tenant",
+        access_config=OnedriveAccessConfig(client_cred="client-cred"),
+    )
+    token = connection_config.get_token()
+
+    assert token == {"access_token": "token"}
+    pickle.dumps(connection_config)
@@ -1,9 +1,14 @@
 import json
 import os
+import threading
 import typing as t
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from html import unescape
 from pathlib import Path
+from time import time
 from urllib.parse import urlparse
 
 from unstructured_ingest.enhanced_dataclass import enhanced_field
@@ -29,6 +34,29 @@ if t.TYPE_CHECKING:
 
 MAX_MB_SIZE = 512_000_000
 CONTENT_LABELS = ["CanvasContent1", "LayoutWebpartsContent1", "TimeCreated"]
+PAGE_EXPAND_FIELDS = ["FirstPublished", "Modified", "Version"]
+PAGE_PROPERTY_FIELDS = ["FirstPublished", "Modified", "Version", "AbsoluteUrl"]
+FILE_PROPERTY_FIELDS = ["TimeCreated", "TimeLastModified", "MajorVersion", "LinkingUrl"]
+GRAPH_API_BATCH_LIMIT = 20
+MAX_INDEX_WORKERS = 16
+
+# ClientContext instances are reused per thread rather than rebuilt per call; office365
+# contexts are not safe to share across concurrently executing threads, so the cache is
+# kept thread-local. Module-level (instead of on the config) so configs stay picklable.
+_site_client_cache = threading.local()
+
+
+@lru_cache(maxsize=None)
+def _permissions_filename_index(read_dir: str) -> t.Dict[str, t.List[str]]:
+    """Maps document name to the permissions filenames that reference it.
+
+    The permissions directory is written once before documents are processed, so the
+    listing can be indexed a single time instead of rescanned per document."""
+    index: t.Dict[str, t.List[str]] = {}
+    for filename in os.listdir(read_dir):
+        docname = os.path.splitext(filename)[0].split("_SEP_")[1]
+        index.setdefault(docname, []).append(filename)
+    return index
 
 
 @dataclass
@@ -60,6 +88,13 @@ class SimpleSharepointConfig(BaseConnectorConfig):
         from office365.runtime.auth.client_credential import ClientCredential
         from office365.sharepoint.client_context import ClientContext
 
+        clients = getattr(_site_client_cache, "clients", None)
+        if clients is None:
+            clients = _site_client_cache.clients = {}
+        cache_key = (self.client_id, site_url or self.site)
+        if cached_client := clients.get(cache_key):
+            return cached_client
+
         try:
             site_client = ClientContext(site_url or self.site).with_credentials(
                 ClientCredential(self.client_id, self.access_config.client_cred),
@@ -67,6 +102,7 @@ class SimpleSharepointConfig(BaseConnectorConfig):
         except Exception:
             logger.error("Couldn't set Sharepoint client.")
             raise
+        clients[cache_key] = site_client
         return site_client
 
     def get_permissions_client(self):
@@ -85,6 +121,7 @@ class SharepointIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
     server_path: str
     is_page: bool
     file_path: str
+    file_properties: t.Optional[t.Dict[str, t.Any]] = None
     registry_name: str = "sharepoint"
 
     def __post_init__(self):
@@ -136,7 +173,9 @@ class SharepointIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
             else:
                 file = site_client.web.get_file_by_server_relative_url(self.server_path)
                 if properties_only:
-                    file = file.get().execute_query()
+                    # update_source_metadata only reads these fields; don't pull
+                    # the full property set over the wire
+                    file = file.select(FILE_PROPERTY_FIELDS).get().execute_query()
         except ClientRequestException as e:
             if e.response.status_code == 404:
                 return None
@@ -148,7 +187,7 @@ class SharepointIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
         try:
             page = (
                 site_client.site_pages.pages.get_by_url(self.server_path)
-                .expand(["FirstPublished", "Modified", "Version"])
+                .expand(PAGE_EXPAND_FIELDS)
                 .get()
                 .execute_query()
             )
@@ -175,28 +214,57 @@ class SharepointIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
         if permissions_dir.is_dir():
             parent_type = self.file_path.split("/")[0]
 
-            if parent_type == "sites":
-                read_dir = permissions_dir / "sites"
-            elif parent_type == "SitePages" or parent_type == "Shared Documents":
-                read_dir = permissions_dir / "other"
-            else:
-                read_dir = permissions_dir / "other"
-
-            for filename in os.listdir(read_dir):
-                permissions_docname = os.path.splitext(filename)[0].split("_SEP_")[1]
-                ingestdoc_docname = self.file_path.split("/")[-1]
+            read_dir = permissions_dir / ("sites" if parent_type == "sites" else "other")
 
-                if ingestdoc_docname == permissions_docname and parent_name_matches(
+            ingestdoc_docname = self.file_path.split("/")[-1]
+            for filename in _permissions_filename_index(str(read_dir)).get(ingestdoc_docname, []):
+                if parent_name_matches(
                     parent_type=parent_type,
                     permissions_filename=filename,
                     ingest_doc_filepath=self.file_path,
                 ):
                     with open(read_dir / filename) as f:
-                        permissions_data = json.loads(f.read())
+                        permissions_data = json.load(f)
 
         return permissions_data
 
+    def _source_metadata_from_properties(self) -> t.Optional[SourceMetadata]:
+        """Builds source metadata from properties captured when the file/page was
+        listed, skipping the round-trip to re-fetch an object the indexer already
+        had in hand. Returns None when the captured set is incomplete."""
+        properties = self.file_properties or {}
+        required_keys = (
+            {"Modified", "Version", "AbsoluteUrl"}
+            if self.is_page
+            else {"TimeCreated", "TimeLastModified", "MajorVersion"}
+        )
+        if not required_keys <= properties.keys():
+            return None
+        permissions_data = (
+            self.update_permissions_data() if self.connector_config.permissions_config else None
+        )
+        if self.is_page:
+            return SourceMetadata(
+                date_created=properties.get("FirstPublished", None),
+                date_modified=properties.get("Modified", None),
+                version=properties.get("Version", ""),
+                source_url=properties.get("AbsoluteUrl", None),
+                exists=True,
+                permissions_data=permissions_data,
+            )
+        return SourceMetadata(
+            date_created=ensure_isoformat_datetime(timestamp=properties["TimeCreated"]),
+            date_modified=ensure_isoformat_datetime(timestamp=properties["TimeLastModified"]),
+            version=properties["MajorVersion"],
+            source_url=properties.get("LinkingUrl", None),
+            exists=True,
+            permissions_data=permissions_data,
+        )
+
     def update_source_metadata(self, **kwargs):
+        if source_metadata := self._source_metadata_from_properties():
+            self.source_metadata = source_metadata
+            return
         if self.is_page:
             page = self._fetch_page()
             if page is None:
@@ -275,7 +343,7 @@ class SharepointIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
                 file.download_session(f, chunk_size=1024 * 1024 * 100).execute_query()
         else:
             with self.filename.open(mode="wb") as f:
-                file.download(f).execute_query()
+                file.download_session(f).execute_query()
         logger.info(f"file downloaded: {self.filename}")
 
     @BaseSingleIngestDoc.skip_if_file_exists
@@ -305,20 +373,23 @@ class SharepointSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector
     def _list_files(self, folder, recursive) -> t.List["File"]:
         from office365.runtime.client_request_exception import ClientRequestException
 
-        try:
-            objects = folder.expand(["Files", "Folders"]).get().execute_query()
-            files = list(objects.files)
-            if not recursive:
-                return files
-            for f in objects.folders:
-                if "/Forms" in f.serverRelativeUrl:
-                    continue
-                files += self._list_files(f, recursive)
-            return files
-        except ClientRequestException as e:
-            if e.response.status_code != 404:
-                logger.info("Caught an error while processing documents %s", e.response.text)
-            return []
+        # Iterative BFS over the folder tree: one expanded query per folder, no
+        # recursion depth limit. Queries stay sequential because every folder
+        # shares the same (non-thread-safe) site client.
+        files: t.List["File"] = []
+        queue = deque([folder])
+        while queue:
+            current = queue.popleft()
+            try:
+                objects = current.expand(["Files", "Folders"]).get().execute_query()
+            except ClientRequestException as e:
+                if e.response.status_code != 404:
+                    logger.info("Caught an error while processing documents %s", e.response.text)
+                continue
+            files.extend(objects.files)
+            if recursive:
+                queue.extend(f for f in objects.folders if "/Forms" not in f.serverRelativeUrl)
+        return files
 
     def _prepare_ingest_doc(self, obj: t.Union["File", "SitePage"], base_url, is_page=False):
         if is_page:
@@ -326,9 +397,15 @@ class SharepointSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector
             server_path = file_path if file_path[0] != "/" else file_path[1:]
             if (url_path := (urlparse(base_url).path)) and (url_path != "/"):
                 file_path = url_path[1:] + "/" + file_path
+            metadata_keys = PAGE_PROPERTY_FIELDS
         else:
             server_path = obj.serverRelativeUrl
             file_path = obj.serverRelativeUrl[1:]
+            metadata_keys = FILE_PROPERTY_FIELDS
+
+        # Carry over the properties already returned by the listing query so
+        # update_source_metadata doesn't have to re-fetch the object later
+        file_properties = {k: obj.properties[k] for k in metadata_keys if k in obj.properties}
 
         return SharepointIngestDoc(
             processor_config=self.processor_config,
@@ -338,6 +415,7 @@ class SharepointSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector
             server_path=server_path,
             is_page=is_page,
             file_path=file_path,
+            file_properties=file_properties,
         )
 
     @requires_dependencies(["office365"], extras="sharepoint")
@@ -345,7 +423,9 @@ class SharepointSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector
         from office365.runtime.client_request_exception import ClientRequestException
 
         try:
-            site_pages = site_client.site_pages.pages.get().execute_query()
+            site_pages = (
+                site_client.site_pages.pages.expand(PAGE_EXPAND_FIELDS).get().execute_query()
+            )
         except ClientRequestException as e:
             logger.info(
                 "Caught an error while retrieving site pages from %s \n%s",
@@ -402,14 +482,32 @@ class SharepointSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector
         tenant = base_site_client.tenant
         tenant_sites = tenant.get_site_properties_from_sharepoint_by_filters().execute_query()
         tenant_sites = {s.url for s in tenant_sites if (s.url is not None)}
-        ingest_docs: t.List[SharepointIngestDoc] = []
-        for site_url in tenant_sites:
+
+        def process_site(site_url: str) -> t.List[SharepointIngestDoc]:
             logger.info(f"processing docs for site: {site_url}")
+            # Each worker builds its own client: office365 contexts are not
+            # safe to share across concurrently executing threads.
             site_client = self.connector_config.get_site_client(site_url)
-            ingest_docs = ingest_docs + self._ingest_site_docs(site_client)
+            return self._ingest_site_docs(site_client)
+
+        ingest_docs: t.List[SharepointIngestDoc] = []
+        if not tenant_sites:
+            return ingest_docs
+        with ThreadPoolExecutor(max_workers=min(len(tenant_sites), MAX_INDEX_WORKERS)) as executor:
+            for site_docs in executor.map(process_site, tenant_sites):
+                ingest_docs.extend(site_docs)
         return ingest_docs
 
 
+# weburl path roots with a fixed (parent_type, parent_name); "sites" is handled
+# separately since its parent name comes from the path itself
+_STATIC_PARENT_TYPES = {
+    "Shared%20Documents": ("Shared Documents", "Shared Documents"),
+    "personal": ("Personal", "Personal"),
+    "_layouts": ("layouts", "layouts"),
+}
+
+
 @dataclass
 class SharepointPermissionsConnector:
     def __init__(self, permissions_config):
@@ -417,7 +515,19 @@ class SharepointPermissionsConnector:
         self.initialize()
 
     def initialize(self):
-        self.access_token: str = self.get_access_token()
+        self._access_token: t.Optional[str] = None
+        self._token_expiry: float = 0.0
+        # Acquire eagerly so bad credentials surface at init time
+        if not self.access_token:
+            raise SourceConnectionError(
+                "Couldn't obtain Sharepoint permissions ingestion access token",
+            )
+
+    @property
+    def access_token(self) -> str:
+        if self._access_token is None or time() >= self._token_expiry:
+            self._access_token = self.get_access_token()
+        return self._access_token
 
     @requires_dependencies(["requests"], extras="sharepoint")
     def get_access_token(self) -> str:
@@ -434,7 +544,10 @@ class SharepointPermissionsConnector:
             "grant_type": "client_credentials",
         }
         response = requests.post(url, headers=headers, data=data)
-        return response.json()["access_token"]
+        payload = response.json()
+        # refresh a minute ahead of expiry rather than re-acquiring per call
+        self._token_expiry = time() + float(payload.get("expires_in", 3600)) - 60
+        return payload["access_token"]
 
     def validated_response(self, response):
         if response.status_code == 200:
@@ -493,14 +606,8 @@ class SharepointPermissionsConnector:
         if split_path[0] == "sites":
             return "sites", split_path[1]
 
-        elif split_path[0] == "Shared%20Documents":
-            return "Shared Documents", "Shared Documents"
-
-        elif split_path[0] == "personal":
-            return "Personal", "Personal"
-
-        elif split_path[0] == "_layouts":
-            return "layouts", "layouts"
+        if static_parent := _STATIC_PARENT_TYPES.get(split_path[0]):
+            return static_parent
 
         # if other weburl structures are found, additional logic might need to be implemented
 
@@ -527,6 +634,47 @@ class SharepointPermissionsConnector:
 
         return self.validated_response(response)
 
+    @requires_dependencies(["requests"], extras="sharepoint")
+    def get_permissions_for_drive_items(self, drive_items: t.List[t.Tuple[str, str, str]]):
+        """Fetches permissions for multiple drive items in chunked $batch requests,
+        avoiding one HTTPS round-trip per item. Yields one response body (or None on
+        failure) per input item, in order."""
+        import requests
+
+        url = "https://graph.microsoft.com/v1.0/$batch"
+
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "Content-Type": "application/json",
+        }
+
+        for chunk_start in range(0, len(drive_items), GRAPH_API_BATCH_LIMIT):
+            chunk = drive_items[chunk_start : chunk_start + GRAPH_API_BATCH_LIMIT]
+            requests_payload = [
+                {
+                    "id": str(i),
+                    "method": "GET",
+                    "url": f"/sites/{site}/drives/{drive_id}/items/{item_id}/permissions",
+                }
+                for i, (site, drive_id, item_id) in enumerate(chunk)
+            ]
+
+            response = requests.post(url, headers=headers, json={"requests": requests_payload})
+            batch_response = self.validated_response(response)
+            if not batch_response:
+                yield from (None for _ in chunk)
+                continue
+
+            responses_by_id = {resp["id"]: resp for resp in batch_response.get("responses", [])}
+            for i, _ in enumerate(chunk):
+                resp = responses_by_id.get(str(i))
+                if resp and resp.get("status") == 200:
+                    yield resp.get("body")
+                else:
+                    if resp:
+                        logger.info(f"batched permissions request failed: {resp}")
+                    yield None
+
     def write_all_permissions(self, output_dir):
         sites = [(site["id"], site["webUrl"]) for site in self.get_sites()["value"]]
         drive_ids = []
@@ -540,31 +688,39 @@ class SharepointPermissionsConnector:
 
         logger.info("Obtaining item data from drives for permissions (rbac)")
         item_ids = []
-        for site, drive_id in drive_ids:
-            drive_items = self.get_drive_items(site, drive_id)
-            if drive_items:
-                item_ids.extend(
-                    [
-                        (site, drive_id, item["id"], item["name"], item["webUrl"])
-                        for item in drive_items["value"]
-                    ],
+        if drive_ids:
+            # Each drive listing is an independent Graph request; fan them out
+            with ThreadPoolExecutor(max_workers=min(len(drive_ids), MAX_INDEX_WORKERS)) as executor:
+                drive_item_results = list(
+                    executor.map(lambda args: self.get_drive_items(*args), drive_ids)
                 )
+            for (site, drive_id), drive_items in zip(drive_ids, drive_item_results):
+                if drive_items:
+                    item_ids.extend(
+                        [
+                            (site, drive_id, item["id"], item["name"], item["webUrl"])
+                            for item in drive_items["value"]
+                        ],
+                    )
 
         permissions_dir = Path(output_dir) / "permissions_data"
 
+        # The directory is about to be rewritten; drop any listing cached by a
+        # previous pipeline run in this process so docs don't read stale entries
+        _permissions_filename_index.cache_clear()
+
         logger.info("Writing permissions data to disk")
-        for site, drive_id, item_id, item_name, item_web_url in item_ids:
-            res = self.get_permissions_for_drive_item(site, drive_id, item_id)
+        permission_responses = self.get_permissions_for_drive_items(
+            [(site, drive_id, item_id) for site, drive_id, item_id, _, _ in item_ids],
+        )
+        for (site, drive_id, item_id, item_name, item_web_url), res in zip(
+            item_ids, permission_responses
+        ):
             if res:
                 parent_type, parent_name = self.extract_site_name_from_weburl(item_web_url)
 
-                if parent_type == "sites":
-                    write_path = permissions_dir / "sites" / f"{parent_name}_SEP_{item_name}.json"
-
-                elif parent_type == "Personal" or parent_type == "Shared Documents":
-                    write_path = permissions_dir / "other" / f"{parent_name}_SEP_{item_name}.json"
-                else:
-                    write_path = permissions_dir / "other" / f"{parent_name}_SEP_{item_name}.json"
+                subdir = "sites" if parent_type == "sites" else "other"
+                write_path = permissions_dir / subdir / f"{parent_name}_SEP_{item_name}.json"
 
                 if not Path(os.path.dirname(write_path)).is_dir():
                     os.makedirs(os.path.dirname(write_path))
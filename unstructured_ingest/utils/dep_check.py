@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import importlib
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import (
     Callable,
     List,
@@ -68,7 +68,10 @@ def requires_dependencies(
     return decorator
 
 
+@lru_cache(maxsize=None)
 def dependency_exists(dependency: str):
+    # Cached: decorated functions run this check on every call, and whether a
+    # dependency is installed doesn't change within a process
     try:
         importlib.import_module(dependency)
     except ImportError as e:
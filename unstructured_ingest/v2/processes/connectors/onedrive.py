@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from time import time
@@ -44,6 +45,31 @@ if TYPE_CHECKING:
 CONNECTOR_TYPE = "onedrive"
 MAX_BYTES_SIZE = 512_000_000
 
+# msal apps are cached per credential set rather than stored on the config: the app
+# holds locks (token cache, throttled HTTP client) that would make the pydantic model
+# unpicklable, and connection configs get pickled into multiprocessing steps
+_msal_app_cache: dict = {}
+
+_JSON_PRIMITIVES = (str, int, float, bool, type(None))
+
+
+def _is_json_serializable(value: Any) -> bool:
+    """Cheap type-based serializability check, avoiding a full json.dumps encode
+    (which serializes the whole value just to throw it away) for common types."""
+    if isinstance(value, _JSON_PRIMITIVES):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_json_serializable(v) for v in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(k, _JSON_PRIMITIVES) and _is_json_serializable(v) for k, v in value.items()
+        )
+    try:
+        json.dumps(value)
+    except TypeError:
+        return False
+    return True
+
 
 class OnedriveAccessConfig(AccessConfig):
     client_cred: str = Field(description="Microsoft App client secret")
@@ -69,19 +95,30 @@ class OnedriveConnectionConfig(ConnectionConfig):
         return drive
 
     @requires_dependencies(["msal"], extras="onedrive")
-    def get_token(self):
+    def _get_msal_app(self):
         from msal import ConfidentialClientApplication
 
+        # Built once per credential set: GraphClient invokes the token callback per
+        # request, and rebuilding the app re-unwraps the pydantic secret and discards
+        # msal's internal token cache each time
+        cache_key = (self.authority_url, self.tenant, self.client_id)
+        if app := _msal_app_cache.get(cache_key):
+            return app
         try:
             app = ConfidentialClientApplication(
                 authority=f"{self.authority_url}/{self.tenant}",
                 client_id=self.client_id,
                 client_credential=self.access_config.get_secret_value().client_cred,
             )
-            token = app.acquire_token_for_client(scopes=["https://graph.microsoft.com/.default"])
         except ValueError as exc:
             logger.error("Couldn't set up credentials for OneDrive")
             raise exc
+        _msal_app_cache[cache_key] = app
+        return app
+
+    def get_token(self):
+        app = self._get_msal_app()
+        token = app.acquire_token_for_client(scopes=["https://graph.microsoft.com/.default"])
         if "error" in token:
             raise SourceConnectionNetworkError(
                 "failed to fetch token, {}: {}".format(token["error"], token["error_description"])
@@ -118,19 +155,22 @@ class OnedriveIndexer(Indexer):
             logger.error(f"failed to validate connection: {e}", exc_info=True)
             raise SourceConnectionError(f"failed to validate connection: {e}")
 
-    def list_objects_sync(self, folder: DriveItem, recursive: bool) -> list["DriveItem"]:
-        drive_items = folder.children.get().execute_query()
-        files = [d for d in drive_items if d.is_file]
-        if not recursive:
-            return files
-
-        folders = [d for d in drive_items if d.is_folder]
-        for f in folders:
-            files.extend(self.list_objects_sync(f, recursive))
-        return files
-
-    async def list_objects(self, folder: "DriveItem", recursive: bool) -> list["DriveItem"]:
-        return await asyncio.to_thread(self.list_objects_sync, folder, recursive)
+    def list_folder_sync(self, folder: "DriveItem") -> list["DriveItem"]:
+        return list(folder.children.get().execute_query())
+
+    async def list_objects(
+        self, folder: "DriveItem", recursive: bool
+    ) -> AsyncIterator["DriveItem"]:
+        # Breadth-first walk yielding files as each folder listing returns, so
+        # downstream steps can start before the whole tree has been traversed
+        folders = deque([folder])
+        while folders:
+            drive_items = await asyncio.to_thread(self.list_folder_sync, folders.popleft())
+            for drive_item in drive_items:
+                if drive_item.is_file:
+                    yield drive_item
+                elif recursive and drive_item.is_folder:
+                    folders.append(drive_item)
 
     def get_root_sync(self, client: "GraphClient") -> "DriveItem":
         root = client.users[self.connection_config.user_pname].drive.get().execute_query().root
@@ -145,24 +185,18 @@ class OnedriveIndexer(Indexer):
 
     def get_properties_sync(self, drive_item: "DriveItem") -> dict:
         properties = drive_item.properties
-        filtered_properties = {}
-        for k, v in properties.items():
-            try:
-                json.dumps(v)
-                filtered_properties[k] = v
-            except TypeError:
-                pass
-        return filtered_properties
+        return {k: v for k, v in properties.items() if _is_json_serializable(v)}
 
     async def get_properties(self, drive_item: "DriveItem") -> dict:
         return await asyncio.to_thread(self.get_properties_sync, drive_item)
 
-    def drive_item_to_file_data_sync(self, drive_item: "DriveItem") -> FileData:
-        file_path = drive_item.parent_reference.path.split(":")[-1]
-        file_path = file_path[1:] if file_path and file_path[0] == "/" else file_path
+    def drive_item_to_file_data_sync(
+        self, drive_item: "DriveItem", date_processed: Optional[str] = None
+    ) -> FileData:
+        file_path = drive_item.parent_reference.path.split(":")[-1].lstrip("/")
         filename = drive_item.name
         server_path = file_path + "/" + filename
-        rel_path = server_path.replace(self.index_config.path, "").lstrip("/")
+        rel_path = server_path.removeprefix(self.index_config.path).lstrip("/")
         date_modified_dt = (
             parser.parse(str(drive_item.last_modified_datetime))
             if drive_item.last_modified_datetime
@@ -171,18 +205,20 @@ class OnedriveIndexer(Indexer):
         date_created_at = (
             parser.parse(str(drive_item.created_datetime)) if drive_item.created_datetime else None
         )
-        return FileData(
+        # model_construct skips pydantic validation; everything here is either
+        # produced locally or already validated server-side by the Graph API
+        return FileData.model_construct(
             identifier=drive_item.id,
             connector_type=self.connector_type,
-            source_identifiers=SourceIdentifiers(
+            source_identifiers=SourceIdentifiers.model_construct(
                 fullpath=server_path, filename=drive_item.name, rel_path=rel_path
             ),
-            metadata=FileDataSourceMetadata(
+            metadata=FileDataSourceMetadata.model_construct(
                 url=drive_item.parent_reference.path + "/" + drive_item.name,
                 version=drive_item.etag,
                 date_modified=str(date_modified_dt.timestamp()) if date_modified_dt else None,
                 date_created=str(date_created_at.timestamp()) if date_created_at else None,
-                date_processed=str(time()),
+                date_processed=date_processed or str(time()),
                 record_locator={
                     "user_pname": self.connection_config.user_pname,
                     "server_relative_path": server_path,
@@ -191,9 +227,13 @@ class OnedriveIndexer(Indexer):
             additional_metadata=self.get_properties_sync(drive_item=drive_item),
         )
 
-    async def drive_item_to_file_data(self, drive_item: "DriveItem") -> FileData:
+    async def drive_item_to_file_data(
+        self, drive_item: "DriveItem", date_processed: Optional[str] = None
+    ) -> FileData:
         # Offload the file data creation if it's not guaranteed async
-        return await asyncio.to_thread(self.drive_item_to_file_data_sync, drive_item)
+        return await asyncio.to_thread(
+            self.drive_item_to_file_data_sync, drive_item, date_processed
+        )
 
     def is_async(self) -> bool:
         return True
@@ -208,10 +248,15 @@ class OnedriveIndexer(Indexer):
 
         client = await asyncio.to_thread(self.connection_config.get_client)
         root = await self.get_root(client=client)
-        drive_items = await self.list_objects(folder=root, recursive=self.index_config.recursive)
-
-        for drive_item in drive_items:
-            file_data = await self.drive_item_to_file_data(drive_item=drive_item)
+        # One timestamp for the whole run; second resolution is plenty for
+        # date_processed and avoids a syscall per file
+        date_processed = str(time())
+        async for drive_item in self.list_objects(
+            folder=root, recursive=self.index_config.recursive
+        ):
+            file_data = await self.drive_item_to_file_data(
+                drive_item=drive_item, date_processed=date_processed
+            )
             yield file_data
 
 
@@ -242,8 +287,7 @@ class OnedriveDownloader(Downloader):
         return file
 
     def get_download_path(self, file_data: FileData) -> Optional[Path]:
-        rel_path = file_data.source_identifiers.relative_path
-        rel_path = rel_path[1:] if rel_path.startswith("/") else rel_path
+        rel_path = file_data.source_identifiers.relative_path.lstrip("/")
         return self.download_dir / Path(rel_path)
 
     @SourceConnectionError.wrap
@@ -269,6 +313,11 @@ class OnedriveDownloader(Downloader):
             # Re-raise to see full stack trace locally
             raise
 
+    async def run_async(self, file_data: FileData, **kwargs: Any) -> DownloadResponse:
+        # The default implementation would run the blocking office365 transfer on the
+        # event loop, serializing all downloads; offload it so they can overlap
+        return await asyncio.to_thread(self.run, file_data=file_data, **kwargs)
+
 
 class OnedriveUploaderConfig(UploaderConfig):
     remote_url: str = Field(
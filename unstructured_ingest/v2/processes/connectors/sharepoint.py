@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
+from time import time
 from typing import TYPE_CHECKING, Any, AsyncIterator
 
 from pydantic import Field
@@ -76,11 +77,13 @@ class SharepointIndexer(OnedriveIndexer):
         except ClientRequestException:
             logger.info("Site not found")
 
-        drive_items = await self.list_objects(
+        date_processed = str(time())
+        async for drive_item in self.list_objects(
             folder=site_drive_item, recursive=self.index_config.recursive
-        )
-        for drive_item in drive_items:
-            file_data = await self.drive_item_to_file_data(drive_item=drive_item)
+        ):
+            file_data = await self.drive_item_to_file_data(
+                drive_item=drive_item, date_processed=date_processed
+            )
             yield file_data
 
 
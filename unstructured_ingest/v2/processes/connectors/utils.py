@@ -1,11 +1,13 @@
 import json
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Union
 
 from dateutil import parser
 from pydantic import ValidationError
 
 
+@lru_cache(maxsize=4096)
 def parse_datetime(date_value: Union[int, str, float, datetime]) -> datetime:
     if isinstance(date_value, datetime):
         return date_value